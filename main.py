@@ -2,7 +2,7 @@
 Discord AI Admin Bot
 A Discord administration bot that uses AI to parse natural language commands into server management actions.
 
-Requirements: discord.py>=2.3.2, requests, python-dotenv
+Requirements: discord.py>=2.3.2, aiohttp, python-dotenv (optional: orjson)
 Set environment variables: DISCORD_TOKEN, HUGGINGFACE_TOKEN
 Enable intents: guilds, members, message_content (message_content optional here)
 Note: Only users with Manage Guild (Manage Server) permission may use admin/AI commands.
@@ -10,19 +10,38 @@ Note: Only users with Manage Guild (Manage Server) permission may use admin/AI c
 
 import os
 import asyncio
+import hashlib
 import json
-import uuid
-from typing import List, Dict, Any, Optional
-from threading import Thread
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Awaitable, Callable
 import time
 
+import aiohttp
+from aiohttp import web
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-import requests
 from dotenv import load_dotenv
-from flask import Flask
+
+# orjson is an optional speedup for parsing model output; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    json_loads = json.loads
+
+    def json_dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
 
 load_dotenv()
 DISCORD_TOKEN = os.environ.get("DISCORD_TOKEN")
@@ -38,100 +57,335 @@ intents = discord.Intents.default()
 intents.guilds = True
 intents.members = True
 intents.message_content = False  # not required for admin actions but optional
-bot = commands.Bot(command_prefix="!", intents=intents)
+
+class AdminBot(commands.Bot):
+    async def setup_hook(self):
+        # Runs once on the bot's loop before connecting, so the status page is up during login
+        await start_status_server()
+
+    async def close(self):
+        # Release pooled Hugging Face connections before the gateway shuts down
+        if HF_SESSION is not None and not HF_SESSION.closed:
+            await HF_SESSION.close()
+        if WEB_RUNNER is not None:
+            await WEB_RUNNER.cleanup()
+        await super().close()
+
+bot = AdminBot(command_prefix="!", intents=intents)
 
 # ---------- Helpers & Config ----------
 ADMIN_CHECK = app_commands.checks.has_permissions(manage_guild=True)
 
+# Fallback extractor for the first JSON object when the model wraps it in noise
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+# User mention: <@123> or <@!123>
+_MENTION_RE = re.compile(r'<@!?(\d+)>')
+
+# Basic perm mapping for AI-created roles: allow only common ones if provided
+_PERM_MAP = {
+    "manage_messages":"manage_messages",
+    "kick_members":"kick_members",
+    "ban_members":"ban_members",
+    "administrator":"administrator",
+    "manage_channels":"manage_channels",
+    "manage_guild":"manage_guild"
+}
+# Permission flag names, so untrusted model keys never reach methods like Permissions.update
+_VALID_PERM_ATTRS = frozenset(discord.Permissions.VALID_FLAGS)
+_VALID_OVERWRITE_ATTRS = frozenset(discord.PermissionOverwrite.VALID_NAMES)
+
+# Caps concurrent Discord REST calls issued by AI action batches
+ACTION_SEMAPHORE = asyncio.Semaphore(5)
+
 # In-memory pending actions store: message_id -> {user_id, guild_id, actions}
 PENDING_ACTIONS: Dict[int, Dict[str, Any]] = {}
 
 # ---------- UptimeRobot Web Server (for 24/7 uptime) ----------
-app = Flask(__name__)
+# Served by aiohttp on the bot's own event loop, so handlers can read bot state safely
+WEB_RUNNER: Optional[web.AppRunner] = None
 
-@app.route('/')
-def home():
-    return f'''
+async def status_page(request: web.Request) -> web.Response:
+    return web.Response(text=f'''
     <h1>Discord AI Admin Bot - Status: Online</h1>
     <p>Bot User: {bot.user}</p>
     <p>Connected Guilds: {len(bot.guilds) if bot.guilds else 0}</p>
     <p>Latency: {round(bot.latency * 1000, 2)}ms</p>
     <p>This endpoint keeps the bot alive for UptimeRobot monitoring.</p>
-    '''
-
-def run_flask():
-    """Run Flask server in a separate thread"""
-    app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+    ''', content_type="text/html")
 
-def keep_alive():
+async def start_status_server():
     """Start the web server to keep the bot alive"""
-    server = Thread(target=run_flask)
-    server.daemon = True
-    server.start()
+    global WEB_RUNNER
+    app = web.Application()
+    app.router.add_get("/", status_page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host="0.0.0.0", port=5000).start()
+    except OSError as e:
+        # the keep-alive page is optional; never let it stop the bot from starting
+        print(f"⚠️ UptimeRobot web server failed to start on port 5000: {e}")
+        await runner.cleanup()
+        return
+    WEB_RUNNER = runner
     print("🌐 UptimeRobot web server started on port 5000")
 
-async def call_huggingface_parse(prompt: str, timeout: int = 20) -> str:
+# ---------- Hugging Face batching ----------
+# Prompts from concurrent /server_ai calls are coalesced into one batched inference request.
+HF_MAX_BATCH = 8
+HF_MAX_WAIT = 0.03  # seconds to wait for more prompts before flushing a batch
+HF_ENQUEUE_TIMEOUT = 60  # seconds a caller waits for its result, covering queueing plus the HF call
+HF_QUEUE: "asyncio.Queue[tuple[str, asyncio.Future]]" = asyncio.Queue()
+HF_BATCH_TASK: Optional[asyncio.Task] = None
+
+# Shared keep-alive HTTP session for Hugging Face, created in on_ready and closed with the bot
+HF_SESSION: Optional[aiohttp.ClientSession] = None
+
+class HFError(Exception):
+    """Raised when the Hugging Face Inference API call fails."""
+
+HF_ERROR_BODY_LIMIT = 512  # bytes of an error response kept for the message
+
+def _generated_text(item: Any) -> str:
+    """Extract generated text from one entry of a batched HF response: {...} or [{...}]."""
+    if isinstance(item, list) and item:
+        item = item[0]
+    if isinstance(item, dict) and isinstance(item.get("generated_text"), str):
+        return item["generated_text"].strip()
+    raise HFError(f"unexpected shape: {type(item).__name__}")
+
+async def call_huggingface_parse(prompts: List[str], timeout: int = 20) -> List[str]:
     """
-    Calls Hugging Face Inference API synchronously inside thread pool and returns model text.
+    Calls Hugging Face Inference API over the shared aiohttp session and returns one model text per prompt.
     Uses a more specific model that can handle structured JSON responses.
+    Raises HFError on transport or API errors.
     """
-    loop = asyncio.get_running_loop()
-    
     # Use a better model for JSON parsing - Mistral 7B Instruct
     hf_url = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.1"
     
-    def _call():
-        payload = {
-            "inputs": prompt,
-            "parameters": {
-                "max_new_tokens": 800,
-                "temperature": 0.1,
-                "do_sample": True,
-                "return_full_text": False
-            }
-        }
-        
-        response = requests.post(hf_url, headers=HF_HEADERS, json=payload, timeout=timeout)
-        if response.status_code == 200:
-            result = response.json()
-            if isinstance(result, list) and len(result) > 0:
-                return result[0].get("generated_text", "")
-            return str(result)
-        else:
-            return f"(HF API error {response.status_code}) {response.text}"
+    payload = {
+        "inputs": prompts,
+        "parameters": {
+            "max_new_tokens": 800,
+            "temperature": 0.1,
+            "do_sample": True,
+            "return_full_text": False
+        },
+        # block until the model is loaded instead of getting a 503, so the response is always a list
+        "options": {"wait_for_model": True, "use_cache": True}
+    }
     
+    if HF_SESSION is None or HF_SESSION.closed:
+        raise HFError("HTTP session not initialized")
     try:
-        resp = await asyncio.wait_for(loop.run_in_executor(None, _call), timeout=timeout)
-        return resp.strip() if resp else ""
-    except Exception as e:
-        return f"(Hugging Face error) {e}"
+        async with asyncio.timeout(timeout):
+            async with HF_SESSION.post(hf_url, headers=HF_HEADERS, json=payload) as r:
+                if r.status == 200:
+                    result = await r.json(loads=json_loads)
+                    if not isinstance(result, list) or len(result) != len(prompts):
+                        raise HFError(f"unexpected shape: {type(result).__name__}")
+                    return [_generated_text(item) for item in result]
+                else:
+                    # error pages can be large HTML; only read enough for a readable message
+                    body = await r.content.read(HF_ERROR_BODY_LIMIT)
+                    more = not r.content.at_eof()
+                    detail = body.decode(errors="replace") + ("…" if more else "")
+                    raise HFError(f"API error {r.status}: {detail}")
+    except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+        raise HFError(str(e) or type(e).__name__) from e
+
+async def hf_batch_worker():
+    """Drain queued prompts in batches of up to HF_MAX_BATCH and resolve their futures."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await HF_QUEUE.get()]
+        deadline = loop.time() + HF_MAX_WAIT
+        while len(batch) < HF_MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                async with asyncio.timeout(remaining):
+                    batch.append(await HF_QUEUE.get())
+            except TimeoutError:
+                break
+        try:
+            texts = await call_huggingface_parse([prompt for prompt, _ in batch])
+        except Exception as e:
+            # forward every failure so the worker survives and no caller is left waiting
+            if not isinstance(e, HFError):
+                e = HFError(f"unexpected error: {e}")
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            continue
+        for (_, fut), text in zip(batch, texts):
+            if not fut.done():
+                fut.set_result(text)
+
+# ---------- Hugging Face response cache ----------
+# instruction hash -> (stored_at, model_text); LRU-evicted and expired after HF_CACHE_TTL
+HF_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+HF_CACHE_MAX = 512
+HF_CACHE_TTL = 3600  # seconds, so prompt changes take effect
+
+def _hf_cache_key(instruction: str) -> str:
+    return hashlib.blake2b(instruction.encode(), digest_size=16).hexdigest()
+
+def hf_cache_get(instruction: str) -> Optional[str]:
+    key = _hf_cache_key(instruction)
+    entry = HF_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, model_text = entry
+    if time.monotonic() - stored_at > HF_CACHE_TTL:
+        del HF_CACHE[key]
+        return None
+    HF_CACHE.move_to_end(key)
+    return model_text
+
+def hf_cache_put(instruction: str, model_text: str) -> None:
+    key = _hf_cache_key(instruction)
+    HF_CACHE[key] = (time.monotonic(), model_text)
+    HF_CACHE.move_to_end(key)
+    while len(HF_CACHE) > HF_CACHE_MAX:
+        HF_CACHE.popitem(last=False)
+
+async def enqueue_prompt(prompt: str) -> str:
+    """Queue a prompt for the batch worker and wait for its model text."""
+    fut = asyncio.get_running_loop().create_future()
+    await HF_QUEUE.put((prompt, fut))
+    try:
+        async with asyncio.timeout(HF_ENQUEUE_TIMEOUT):
+            return await fut
+    except TimeoutError:
+        raise HFError("timed out waiting for the model") from None
+
+# Constant parts of the parse prompt; only the instruction varies per call
+_PROMPT_PREFIX = """<s>[INST] You are a Discord bot command parser. Convert natural language into JSON actions.
+
+ALLOWED ACTIONS:
+- create_channel: {"type":"create_channel", "channel_type":"text"|"voice", "name":"string", "category":"string"}
+- delete_channel: {"type":"delete_channel", "name_or_id":"string"}
+- create_role: {"type":"create_role", "name":"string", "color":"#hexcolor"}
+- delete_role: {"type":"delete_role", "name_or_id":"string"}
+- assign_role: {"type":"assign_role", "user":"string", "role":"string"}
+- remove_role: {"type":"remove_role", "user":"string", "role":"string"}
+- lock_channel: {"type":"lock_channel", "name_or_id":"string"}
+- unlock_channel: {"type":"unlock_channel", "name_or_id":"string"}
+- create_category: {"type":"create_category", "name":"string"}
+- set_channel_permissions: {"type":"set_channel_permissions", "channel":"string", "role_or_user":"string", "permissions":{"send_messages":boolean}}
+
+INSTRUCTION: """
+_PROMPT_SUFFIX = """
+
+Response format: {"actions": [action1, action2, ...]}
+Only respond with valid JSON. No explanations. [/INST]</s>"""
 
 def build_parse_prompt(user_instruction: str) -> str:
     """
     Prompt for Hugging Face model to parse instructions into Discord actions.
     Optimized for Mistral/Llama-style models that work better with more structured prompts.
     """
-    return f"""<s>[INST] You are a Discord bot command parser. Convert natural language into JSON actions.
-
-ALLOWED ACTIONS:
-- create_channel: {{"type":"create_channel", "channel_type":"text"|"voice", "name":"string", "category":"string"}}
-- delete_channel: {{"type":"delete_channel", "name_or_id":"string"}}
-- create_role: {{"type":"create_role", "name":"string", "color":"#hexcolor"}}
-- delete_role: {{"type":"delete_role", "name_or_id":"string"}}
-- assign_role: {{"type":"assign_role", "user":"string", "role":"string"}}
-- remove_role: {{"type":"remove_role", "user":"string", "role":"string"}}
-- lock_channel: {{"type":"lock_channel", "name_or_id":"string"}}
-- unlock_channel: {{"type":"unlock_channel", "name_or_id":"string"}}
-- create_category: {{"type":"create_category", "name":"string"}}
-- set_channel_permissions: {{"type":"set_channel_permissions", "channel":"string", "role_or_user":"string", "permissions":{{"send_messages":boolean}}}}
-
-INSTRUCTION: {user_instruction}
-
-Response format: {{"actions": [action1, action2, ...]}}
-Only respond with valid JSON. No explanations. [/INST]</s>"""
+    return _PROMPT_PREFIX + user_instruction + _PROMPT_SUFFIX
 
 # ---------- Execution helpers ----------
-async def find_channel_by_name_or_id(guild: discord.Guild, name_or_id: str) -> Optional[discord.abc.GuildChannel]:
+@dataclass
+class GuildIndex:
+    """
+    Name -> object lookups for one guild, reused across action batches.
+    Each map is built on first use, so batches that never look up members never walk guild.members.
+    """
+    guild: discord.Guild
+    _members_by_name: Optional[Dict[str, discord.Member]] = field(default=None, init=False, repr=False)
+    _roles_by_name: Optional[Dict[str, discord.Role]] = field(default=None, init=False, repr=False)
+    _channels_by_name: Optional[Dict[str, discord.abc.GuildChannel]] = field(default=None, init=False, repr=False)
+    # case-insensitive fallbacks, keyed by str.casefold(), for model output like "General" vs "general"
+    _roles_by_cf_name: Optional[Dict[str, discord.Role]] = field(default=None, init=False, repr=False)
+    _channels_by_cf_name: Optional[Dict[str, discord.abc.GuildChannel]] = field(default=None, init=False, repr=False)
+
+    @staticmethod
+    def _member_keys(m: discord.Member) -> tuple[str, str]:
+        return m.name, f"{m.name}#{m.discriminator}"
+
+    @property
+    def members_by_name(self) -> Dict[str, discord.Member]:
+        if self._members_by_name is None:
+            # setdefault keeps the first match, mirroring discord.utils.get
+            members: Dict[str, discord.Member] = {}
+            for m in self.guild.members:
+                for key in self._member_keys(m):
+                    members.setdefault(key, m)
+            self._members_by_name = members
+        return self._members_by_name
+
+    @property
+    def roles_by_name(self) -> Dict[str, discord.Role]:
+        if self._roles_by_name is None:
+            self._build_roles()
+        return self._roles_by_name
+
+    @property
+    def roles_by_cf_name(self) -> Dict[str, discord.Role]:
+        if self._roles_by_cf_name is None:
+            self._build_roles()
+        return self._roles_by_cf_name
+
+    @property
+    def channels_by_name(self) -> Dict[str, discord.abc.GuildChannel]:
+        if self._channels_by_name is None:
+            self._build_channels()
+        return self._channels_by_name
+
+    @property
+    def channels_by_cf_name(self) -> Dict[str, discord.abc.GuildChannel]:
+        if self._channels_by_cf_name is None:
+            self._build_channels()
+        return self._channels_by_cf_name
+
+    def _build_roles(self) -> None:
+        roles: Dict[str, discord.Role] = {}
+        roles_cf: Dict[str, discord.Role] = {}
+        for r in self.guild.roles:
+            roles.setdefault(r.name, r)
+            roles_cf.setdefault(r.name.casefold(), r)
+        self._roles_by_name, self._roles_by_cf_name = roles, roles_cf
+
+    def _build_channels(self) -> None:
+        channels: Dict[str, discord.abc.GuildChannel] = {}
+        channels_cf: Dict[str, discord.abc.GuildChannel] = {}
+        for ch in self.guild.channels:
+            channels.setdefault(ch.name, ch)
+            channels_cf.setdefault(ch.name.casefold(), ch)
+        self._channels_by_name, self._channels_by_cf_name = channels, channels_cf
+
+    def add_member(self, m: discord.Member) -> None:
+        if self._members_by_name is not None:
+            for key in self._member_keys(m):
+                self._members_by_name.setdefault(key, m)
+
+    def remove_member(self, m: discord.Member) -> None:
+        if self._members_by_name is not None:
+            for key in self._member_keys(m):
+                if self._members_by_name.get(key) is m:
+                    del self._members_by_name[key]
+
+    def reset_roles(self) -> None:
+        self._roles_by_name = self._roles_by_cf_name = None
+
+    def reset_channels(self) -> None:
+        self._channels_by_name = self._channels_by_cf_name = None
+
+# guild_id -> GuildIndex; kept in sync by the member/role/channel events below
+GUILD_INDEXES: Dict[int, GuildIndex] = {}
+
+def get_guild_index(guild: discord.Guild) -> GuildIndex:
+    index = GUILD_INDEXES.get(guild.id)
+    if index is None:
+        index = GUILD_INDEXES[guild.id] = GuildIndex(guild)
+    return index
+
+async def find_channel_by_name_or_id(guild: discord.Guild, name_or_id: str, index: Optional[GuildIndex] = None) -> Optional[discord.abc.GuildChannel]:
     # try by ID
     try:
         cid = int(name_or_id)
@@ -140,11 +394,19 @@ async def find_channel_by_name_or_id(guild: discord.Guild, name_or_id: str) -> O
             return ch
     except:
         pass
-    # try by name
-    ch = discord.utils.get(guild.channels, name=name_or_id)
+    # try by name (index first; it may predate channels created earlier in this batch)
+    index = index or get_guild_index(guild)
+    ch = index.channels_by_name.get(name_or_id)
+    if ch and ch.name == name_or_id:
+        return ch
+    cf_name = name_or_id.casefold()
+    ch = index.channels_by_cf_name.get(cf_name)
+    if ch and ch.name.casefold() == cf_name:
+        return ch
+    ch = discord.utils.find(lambda c: c.name.casefold() == cf_name, guild.channels)
     return ch
 
-async def find_role_by_name_or_id(guild: discord.Guild, name_or_id: str) -> Optional[discord.Role]:
+async def find_role_by_name_or_id(guild: discord.Guild, name_or_id: str, index: Optional[GuildIndex] = None) -> Optional[discord.Role]:
     try:
         rid = int(name_or_id)
         role = guild.get_role(rid)
@@ -152,190 +414,310 @@ async def find_role_by_name_or_id(guild: discord.Guild, name_or_id: str) -> Opti
             return role
     except:
         pass
-    role = discord.utils.get(guild.roles, name=name_or_id)
+    index = index or get_guild_index(guild)
+    role = index.roles_by_name.get(name_or_id)
+    if role and role.name == name_or_id:
+        return role
+    cf_name = name_or_id.casefold()
+    role = index.roles_by_cf_name.get(cf_name)
+    if role and role.name.casefold() == cf_name:
+        return role
+    role = discord.utils.find(lambda r: r.name.casefold() == cf_name, guild.roles)
     return role
 
-async def find_member_by_mention_or_id(guild: discord.Guild, value: str) -> Optional[discord.Member]:
-    # try id
+MEMBER_QUERY_TIMEOUT = 5  # seconds to wait for a guild.query_members response
+
+async def _get_or_fetch_member(guild: discord.Guild, mid: int) -> Optional[discord.Member]:
+    mem = guild.get_member(mid)
+    if mem:
+        return mem
     try:
-        mid = int(value)
-        mem = guild.get_member(mid)
+        return await guild.fetch_member(mid)
+    except discord.HTTPException:
+        return None
+
+async def find_member_by_mention_or_id(guild: discord.Guild, value: str, index: Optional[GuildIndex] = None) -> Optional[discord.Member]:
+    # try mention format, then raw id (fetching from the API if not cached)
+    m = _MENTION_RE.fullmatch(value)
+    if m:
+        return await _get_or_fetch_member(guild, int(m.group(1)))
+    if value.isascii() and value.isdecimal():
+        mem = await _get_or_fetch_member(guild, int(value))
         if mem:
             return mem
-    except:
-        pass
-    # try mention format
-    if value.startswith("<@") and value.endswith(">"):
-        vid = ''.join(ch for ch in value if ch.isdigit())
+    # try by name
+    index = index or get_guild_index(guild)
+    mem = index.members_by_name.get(value)
+    if mem and (mem.name == value or f"{mem.name}#{mem.discriminator}" == value):
+        return mem
+    # fall back to Discord's server-side name search; the member cache may be stale or incomplete
+    query = value.split("#", 1)[0]
+    if not query:
+        return None
+    try:
+        async with asyncio.timeout(MEMBER_QUERY_TIMEOUT):
+            matches = await guild.query_members(query=query, limit=5)
+    except (TimeoutError, discord.ClientException):
+        return None
+    return next((m for m in matches if m.name == value or f"{m.name}#{m.discriminator}" == value), None)
+
+async def _do_create_channel(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    ch_type = action.get("channel_type","text")
+    name = action.get("name") or "new-channel"
+    category_name = action.get("category")
+    category_obj = None
+    if category_name:
+        category_obj = discord.utils.get(guild.categories, name=category_name)
+        if not category_obj:
+            category_obj = await guild.create_category(category_name)
+    if ch_type == "voice":
+        ch = await guild.create_voice_channel(name, category=category_obj)
+    else:
+        overwrites = None
+        # optional overwrites: {"role_name": {"send_messages": False}}
+        if action.get("overwrites"):
+            overwrites = {}
+            for role_name, perms in action["overwrites"].items():
+                r = await find_role_by_name_or_id(guild, role_name, index)
+                if r:
+                    overwrite = discord.PermissionOverwrite()
+                    for k,v in perms.items():
+                        if k in _VALID_OVERWRITE_ATTRS:
+                            setattr(overwrite, k, v)
+                    overwrites[r] = overwrite
+        ch = await guild.create_text_channel(name, category=category_obj, overwrites=overwrites or {})
+    return {"ok":True, "message": f"Created channel {ch.name} ({ch.id})"}
+
+async def _do_delete_channel(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    target = action.get("name_or_id")
+    ch = await find_channel_by_name_or_id(guild, str(target), index)
+    if not ch:
+        return {"ok":False, "message": f"Channel not found: {target}"}
+    await ch.delete()
+    return {"ok":True, "message": f"Deleted channel {target}"}
+
+async def _do_create_role(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    name = action.get("name","NewRole")
+    color = action.get("color")
+    perms = action.get("permissions", [])
+    discord_color = discord.Color.default()
+    if color:
         try:
-            mem = guild.get_member(int(vid))
-            if mem:
-                return mem
+            discord_color = discord.Color(int(color.strip("#"),16))
         except:
             pass
-    # try by name (first match)
-    for m in guild.members:
-        if m.name == value or f"{m.name}#{m.discriminator}" == value:
-            return m
-    return None
+    permissions = discord.Permissions.none()
+    for p in perms:
+        key = _PERM_MAP.get(p)
+        if key in _VALID_PERM_ATTRS:
+            setattr(permissions, key, True)
+    role = await guild.create_role(name=name, color=discord_color, permissions=permissions)
+    return {"ok":True, "message": f"Created role {role.name} ({role.id})"}
+
+async def _do_delete_role(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    target = action.get("name_or_id")
+    role = await find_role_by_name_or_id(guild, str(target), index)
+    if not role:
+        return {"ok":False, "message": f"Role not found: {target}"}
+    await role.delete()
+    return {"ok":True, "message": f"Deleted role {target}"}
+
+async def _do_assign_role(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    user_ref = action.get("user")
+    role_ref = action.get("role")
+    member = await find_member_by_mention_or_id(guild, str(user_ref), index)
+    role = await find_role_by_name_or_id(guild, str(role_ref), index)
+    if not member:
+        return {"ok":False, "message": f"Member not found: {user_ref}"}
+    if not role:
+        return {"ok":False, "message": f"Role not found: {role_ref}"}
+    await member.add_roles(role)
+    return {"ok":True, "message": f"Assigned role {role.name} to {member.display_name}"}
+
+async def _do_remove_role(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    user_ref = action.get("user")
+    role_ref = action.get("role")
+    member = await find_member_by_mention_or_id(guild, str(user_ref), index)
+    role = await find_role_by_name_or_id(guild, str(role_ref), index)
+    if not member:
+        return {"ok":False, "message": f"Member not found: {user_ref}"}
+    if not role:
+        return {"ok":False, "message": f"Role not found: {role_ref}"}
+    await member.remove_roles(role)
+    return {"ok":True, "message": f"Removed role {role.name} from {member.display_name}"}
+
+async def _do_lock_channel(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    target = action.get("name_or_id")
+    ch = await find_channel_by_name_or_id(guild, str(target), index)
+    if not ch:
+        return {"ok":False, "message": f"Channel not found: {target}"}
+    if not isinstance(ch, discord.TextChannel):
+        return {"ok":False, "message": f"Cannot lock non-text channel: {target}"}
+    overwrite = ch.overwrites_for(guild.default_role)
+    overwrite.send_messages = False
+    await ch.set_permissions(guild.default_role, overwrite=overwrite)
+    return {"ok":True, "message": f"Locked channel {ch.name}"}
+
+async def _do_unlock_channel(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    target = action.get("name_or_id")
+    ch = await find_channel_by_name_or_id(guild, str(target), index)
+    if not ch:
+        return {"ok":False, "message": f"Channel not found: {target}"}
+    if not isinstance(ch, discord.TextChannel):
+        return {"ok":False, "message": f"Cannot unlock non-text channel: {target}"}
+    overwrite = ch.overwrites_for(guild.default_role)
+    overwrite.send_messages = True
+    await ch.set_permissions(guild.default_role, overwrite=overwrite)
+    return {"ok":True, "message": f"Unlocked channel {ch.name}"}
+
+async def _do_create_category(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    name = action.get("name","Category")
+    cat = await guild.create_category(name)
+    return {"ok":True, "message": f"Created category {cat.name}"}
+
+async def _do_set_channel_permissions(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex]) -> Dict[str, Any]:
+    target = action.get("channel")
+    ch = await find_channel_by_name_or_id(guild, str(target), index)
+    if not ch:
+        return {"ok":False, "message": f"Channel not found: {target}"}
+    if not isinstance(ch, (discord.TextChannel, discord.VoiceChannel)):
+        return {"ok":False, "message": f"Cannot set permissions on this channel type: {target}"}
+    
+    role_or_user = action.get("role_or_user")
+    permissions = action.get("permissions", {})
+    
+    # Find role or user
+    role = await find_role_by_name_or_id(guild, str(role_or_user), index)
+    member = None if role else await find_member_by_mention_or_id(guild, str(role_or_user), index)
+    
+    if not role and not member:
+        return {"ok":False, "message": f"Role or user not found: {role_or_user}"}
+    
+    target_obj = role or member
+    if target_obj:
+        overwrite = ch.overwrites_for(target_obj)
+        
+        # Set permissions based on provided dict
+        for perm_name, value in permissions.items():
+            if perm_name in _VALID_OVERWRITE_ATTRS:
+                setattr(overwrite, perm_name, value)
+        
+        await ch.set_permissions(target_obj, overwrite=overwrite)
+        target_type = "role" if role else "user"
+        return {"ok":True, "message": f"Set permissions for {target_type} {target_obj.name} in channel {ch.name}"}
+    else:
+        return {"ok":False, "message": "Target role or user not found"}
+
+_ACTION_HANDLERS: Dict[str, Callable[[discord.Guild, Dict[str, Any], Optional[GuildIndex]], Awaitable[Dict[str, Any]]]] = {
+    "create_channel": _do_create_channel,
+    "delete_channel": _do_delete_channel,
+    "create_role": _do_create_role,
+    "delete_role": _do_delete_role,
+    "assign_role": _do_assign_role,
+    "remove_role": _do_remove_role,
+    "lock_channel": _do_lock_channel,
+    "unlock_channel": _do_unlock_channel,
+    "create_category": _do_create_category,
+    "set_channel_permissions": _do_set_channel_permissions,
+}
 
-async def execute_action(guild: discord.Guild, action: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_action(guild: discord.Guild, action: Dict[str, Any], index: Optional[GuildIndex] = None) -> Dict[str, Any]:
     """
     Executes a single action. Returns result dict {ok:bool, message:str}
     """
     typ = action.get("type")
+    handler = _ACTION_HANDLERS.get(typ) if isinstance(typ, str) else None
+    if not handler:
+        return {"ok":False, "message": f"Unknown action type: {typ}"}
     try:
-        if typ == "create_channel":
-            ch_type = action.get("channel_type","text")
-            name = action.get("name") or "new-channel"
-            category_name = action.get("category")
-            category_obj = None
-            if category_name:
-                category_obj = discord.utils.get(guild.categories, name=category_name)
-                if not category_obj:
-                    category_obj = await guild.create_category(category_name)
-            if ch_type == "voice":
-                ch = await guild.create_voice_channel(name, category=category_obj)
-            else:
-                overwrites = None
-                # optional overwrites: {"role_name": {"send_messages": False}}
-                if action.get("overwrites"):
-                    overwrites = {}
-                    for role_name, perms in action["overwrites"].items():
-                        r = await find_role_by_name_or_id(guild, role_name)
-                        if r:
-                            overwrite = discord.PermissionOverwrite()
-                            for k,v in perms.items():
-                                if hasattr(overwrite, k):
-                                    setattr(overwrite, k, v)
-                            overwrites[r] = overwrite
-                ch = await guild.create_text_channel(name, category=category_obj, overwrites=overwrites or {})
-            return {"ok":True, "message": f"Created channel {ch.name} ({ch.id})"}
-        elif typ == "delete_channel":
-            target = action.get("name_or_id")
-            ch = await find_channel_by_name_or_id(guild, str(target))
-            if not ch:
-                return {"ok":False, "message": f"Channel not found: {target}"}
-            await ch.delete()
-            return {"ok":True, "message": f"Deleted channel {target}"}
-        elif typ == "create_role":
-            name = action.get("name","NewRole")
-            color = action.get("color")
-            perms = action.get("permissions", [])
-            discord_color = discord.Color.default()
-            if color:
-                try:
-                    discord_color = discord.Color(int(color.strip("#"),16))
-                except:
-                    pass
-            permissions = discord.Permissions.none()
-            # Basic perm mapping: allow only common ones if provided
-            perm_map = {
-                "manage_messages":"manage_messages",
-                "kick_members":"kick_members",
-                "ban_members":"ban_members",
-                "administrator":"administrator",
-                "manage_channels":"manage_channels",
-                "manage_guild":"manage_guild"
-            }
-            for p in perms:
-                key = perm_map.get(p)
-                if key and hasattr(permissions, key):
-                    setattr(permissions, key, True)
-            role = await guild.create_role(name=name, color=discord_color, permissions=permissions)
-            return {"ok":True, "message": f"Created role {role.name} ({role.id})"}
-        elif typ == "delete_role":
-            target = action.get("name_or_id")
-            role = await find_role_by_name_or_id(guild, str(target))
-            if not role:
-                return {"ok":False, "message": f"Role not found: {target}"}
-            await role.delete()
-            return {"ok":True, "message": f"Deleted role {target}"}
-        elif typ == "assign_role":
-            user_ref = action.get("user")
-            role_ref = action.get("role")
-            member = await find_member_by_mention_or_id(guild, str(user_ref))
-            role = await find_role_by_name_or_id(guild, str(role_ref))
-            if not member:
-                return {"ok":False, "message": f"Member not found: {user_ref}"}
-            if not role:
-                return {"ok":False, "message": f"Role not found: {role_ref}"}
-            await member.add_roles(role)
-            return {"ok":True, "message": f"Assigned role {role.name} to {member.display_name}"}
-        elif typ == "remove_role":
-            user_ref = action.get("user")
-            role_ref = action.get("role")
-            member = await find_member_by_mention_or_id(guild, str(user_ref))
-            role = await find_role_by_name_or_id(guild, str(role_ref))
-            if not member:
-                return {"ok":False, "message": f"Member not found: {user_ref}"}
-            if not role:
-                return {"ok":False, "message": f"Role not found: {role_ref}"}
-            await member.remove_roles(role)
-            return {"ok":True, "message": f"Removed role {role.name} from {member.display_name}"}
-        elif typ == "lock_channel":
-            target = action.get("name_or_id")
-            ch = await find_channel_by_name_or_id(guild, str(target))
-            if not ch:
-                return {"ok":False, "message": f"Channel not found: {target}"}
-            if not isinstance(ch, discord.TextChannel):
-                return {"ok":False, "message": f"Cannot lock non-text channel: {target}"}
-            overwrite = ch.overwrites_for(guild.default_role)
-            overwrite.send_messages = False
-            await ch.set_permissions(guild.default_role, overwrite=overwrite)
-            return {"ok":True, "message": f"Locked channel {ch.name}"}
-        elif typ == "unlock_channel":
-            target = action.get("name_or_id")
-            ch = await find_channel_by_name_or_id(guild, str(target))
-            if not ch:
-                return {"ok":False, "message": f"Channel not found: {target}"}
-            if not isinstance(ch, discord.TextChannel):
-                return {"ok":False, "message": f"Cannot unlock non-text channel: {target}"}
-            overwrite = ch.overwrites_for(guild.default_role)
-            overwrite.send_messages = True
-            await ch.set_permissions(guild.default_role, overwrite=overwrite)
-            return {"ok":True, "message": f"Unlocked channel {ch.name}"}
-        elif typ == "create_category":
-            name = action.get("name","Category")
-            cat = await guild.create_category(name)
-            return {"ok":True, "message": f"Created category {cat.name}"}
-        elif typ == "set_channel_permissions":
-            target = action.get("channel")
-            ch = await find_channel_by_name_or_id(guild, str(target))
-            if not ch:
-                return {"ok":False, "message": f"Channel not found: {target}"}
-            if not isinstance(ch, (discord.TextChannel, discord.VoiceChannel)):
-                return {"ok":False, "message": f"Cannot set permissions on this channel type: {target}"}
-            
-            role_or_user = action.get("role_or_user")
-            permissions = action.get("permissions", {})
-            
-            # Find role or user
-            role = await find_role_by_name_or_id(guild, str(role_or_user))
-            member = None if role else await find_member_by_mention_or_id(guild, str(role_or_user))
-            
-            if not role and not member:
-                return {"ok":False, "message": f"Role or user not found: {role_or_user}"}
-            
-            target_obj = role or member
-            if target_obj:
-                overwrite = ch.overwrites_for(target_obj)
-                
-                # Set permissions based on provided dict
-                for perm_name, value in permissions.items():
-                    if hasattr(overwrite, perm_name):
-                        setattr(overwrite, perm_name, value)
-                
-                await ch.set_permissions(target_obj, overwrite=overwrite)
-                target_type = "role" if role else "user"
-                return {"ok":True, "message": f"Set permissions for {target_type} {target_obj.name} in channel {ch.name}"}
-            else:
-                return {"ok":False, "message": "Target role or user not found"}
-        else:
-            return {"ok":False, "message": f"Unknown action type: {typ}"}
+        return await handler(guild, action, index)
     except Exception as e:
         return {"ok":False, "message": f"Exception: {e}"}
 
+# Upper bound on actions per instruction, so a runaway model response can't flood Discord's API
+MAX_ACTIONS = 25
+
+# Fields each action type needs before it is worth dispatching
+_REQUIRED_KEYS: Dict[str, frozenset] = {
+    "create_channel": frozenset({"name"}),
+    "delete_channel": frozenset({"name_or_id"}),
+    "create_role": frozenset({"name"}),
+    "delete_role": frozenset({"name_or_id"}),
+    "assign_role": frozenset({"user", "role"}),
+    "remove_role": frozenset({"user", "role"}),
+    "lock_channel": frozenset({"name_or_id"}),
+    "unlock_channel": frozenset({"name_or_id"}),
+    "create_category": frozenset({"name"}),
+    "set_channel_permissions": frozenset({"channel", "role_or_user", "permissions"}),
+}
+
+def validate_actions(actions: List[Any]) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Checks model-produced actions before any Discord API call and drops exact duplicates.
+    Returns (actions, None) when valid, or ([], error_message) otherwise.
+    """
+    if len(actions) > MAX_ACTIONS:
+        return [], f"Too many actions ({len(actions)}); the limit is {MAX_ACTIONS}."
+    unique: List[Dict[str, Any]] = []
+    seen = set()
+    for i, a in enumerate(actions, start=1):
+        if not isinstance(a, dict):
+            return [], f"Action {i} is not an object."
+        typ = a.get("type")
+        required = _REQUIRED_KEYS.get(typ) if isinstance(typ, str) else None
+        if required is None:
+            return [], f"Action {i} has unknown type: {typ}"
+        missing = sorted(k for k in required if a.get(k) in (None, ""))
+        if missing:
+            return [], f"Action {i} ({typ}) is missing: {', '.join(missing)}"
+        key = json.dumps(a, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            unique.append(a)
+    return unique, None
+
+# Action fields that name a channel, role, category or member
+# (role names nested as keys of create_channel's "overwrites" are collected in _action_refs)
+_ACTION_REF_KEYS = ("name", "name_or_id", "category", "channel", "role", "user", "role_or_user")
+
+def _action_refs(action: Dict[str, Any]) -> set:
+    refs = {str(action[k]).casefold() for k in _ACTION_REF_KEYS if action.get(k)}
+    overwrites = action.get("overwrites")
+    if isinstance(overwrites, dict):
+        refs.update(str(k).casefold() for k in overwrites)
+    return refs
+
+async def execute_actions(guild: discord.Guild, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Executes actions concurrently where possible, returning results in the original order.
+    Consecutive actions that touch the same name (e.g. create a role, then assign it) run in sequence.
+    """
+    index = get_guild_index(guild)
+
+    async def _run(action: Dict[str, Any]) -> Dict[str, Any]:
+        async with ACTION_SEMAPHORE:
+            return await execute_action(guild, action, index)
+
+    # split into runs of independent actions; a run ends when an action reuses a name from it
+    runs: List[List[Dict[str, Any]]] = []
+    run_refs: set = set()
+    for act in actions:
+        refs = _action_refs(act)
+        if not runs or refs & run_refs:
+            runs.append([])
+            run_refs = set()
+        runs[-1].append(act)
+        run_refs |= refs
+
+    results: List[Dict[str, Any]] = []
+    for run in runs:
+        outcomes = await asyncio.gather(*(_run(a) for a in run), return_exceptions=True)
+        for res in outcomes:
+            if isinstance(res, BaseException):
+                res = {"ok": False, "message": str(res)}
+            results.append(res)
+    return results
+
 # ---------- Interactive confirmation view ----------
 class ConfirmView(discord.ui.View):
     def __init__(self, actions: List[Dict[str,Any]], author_id: int, timeout: int = 120):
@@ -360,10 +742,7 @@ class ConfirmView(discord.ui.View):
         if not guild:
             await interaction.followup.send("❌ Guild not found")
             return
-        results = []
-        for act in self.actions:
-            res = await execute_action(guild, act)
-            results.append(res)
+        results = await execute_actions(guild, self.actions)
         self.result = results
         # send results summary and disable buttons
         summary = "\n".join([f"- {r.get('message')}" for r in results])
@@ -381,11 +760,47 @@ class ConfirmView(discord.ui.View):
         await interaction.response.edit_message(content="Cancelled — no actions were taken.", view=self)
 
 # ---------- Bot events ----------
+# Hash of the last synced command tree, so reconnects and restarts skip the rate-limited global sync
+SYNC_HASH_PATH = os.environ.get("SYNC_HASH_PATH", "/tmp/aimod_sync_hash")
+
+def command_signature_hash() -> str:
+    # hash the same payloads sync() uploads, so any field Discord stores invalidates the hash
+    payload = [c.to_dict(bot.tree) for c in sorted(bot.tree.get_commands(), key=lambda c: c.name)]
+    sig = json.dumps({"application_id": bot.application_id, "commands": payload}, sort_keys=True, default=str)
+    return hashlib.blake2b(sig.encode()).hexdigest()
+
+def read_sync_hash() -> Optional[str]:
+    try:
+        with open(SYNC_HASH_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def write_sync_hash(sig_hash: str) -> None:
+    try:
+        with open(SYNC_HASH_PATH, "w") as f:
+            f.write(sig_hash)
+    except OSError as e:
+        print(f"Could not save command sync hash: {e}")
+
 @bot.event
 async def on_ready():
+    global HF_BATCH_TASK, HF_SESSION
+    if HF_SESSION is None or HF_SESSION.closed:
+        HF_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=20),
+        )
+    if HF_BATCH_TASK is None or HF_BATCH_TASK.done():
+        HF_BATCH_TASK = asyncio.create_task(hf_batch_worker())
     try:
-        synced = await bot.tree.sync()
-        print(f"Synced {len(synced)} command(s)")
+        sig_hash = command_signature_hash()
+        if read_sync_hash() == sig_hash:
+            print("Commands unchanged, skipping sync")
+        else:
+            synced = await bot.tree.sync()
+            write_sync_hash(sig_hash)
+            print(f"Synced {len(synced)} command(s)")
     except Exception as e:
         print(f"Failed to sync commands: {e}")
     if bot.user:
@@ -395,6 +810,57 @@ async def on_ready():
     print(f"🌍 Connected to {len(bot.guilds)} guild(s)")
     print(f"🔄 Bot is ready and operational")
 
+# Keep the cached GuildIndex in sync with the guild
+@bot.event
+async def on_member_join(member: discord.Member):
+    index = GUILD_INDEXES.get(member.guild.id)
+    if index:
+        index.add_member(member)
+
+@bot.event
+async def on_member_remove(member: discord.Member):
+    index = GUILD_INDEXES.get(member.guild.id)
+    if index:
+        index.remove_member(member)
+
+def _reset_roles(guild: discord.Guild) -> None:
+    index = GUILD_INDEXES.get(guild.id)
+    if index:
+        index.reset_roles()
+
+def _reset_channels(guild: discord.Guild) -> None:
+    index = GUILD_INDEXES.get(guild.id)
+    if index:
+        index.reset_channels()
+
+@bot.event
+async def on_guild_role_create(role: discord.Role):
+    _reset_roles(role.guild)
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role):
+    _reset_roles(role.guild)
+
+@bot.event
+async def on_guild_role_update(before: discord.Role, after: discord.Role):
+    _reset_roles(after.guild)
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel):
+    _reset_channels(channel.guild)
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    _reset_channels(channel.guild)
+
+@bot.event
+async def on_guild_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+    _reset_channels(after.guild)
+
+@bot.event
+async def on_guild_remove(guild: discord.Guild):
+    GUILD_INDEXES.pop(guild.id, None)
+
 # ---------- Slash commands (direct safe commands) ----------
 
 @bot.tree.command(name="create_role", description="Create a role with optional hex color")
@@ -577,38 +1043,51 @@ async def server_ai(interaction: discord.Interaction, instruction: str, auto_con
         await interaction.followup.send("❌ This command can only be used in a server.")
         return
 
-    # Build prompt & call Hugging Face to parse into JSON actions
-    prompt = build_parse_prompt(instruction)
-    model_text = await call_huggingface_parse(prompt)
+    # Build prompt & call Hugging Face to parse into JSON actions (reusing a cached response if fresh)
+    model_text = hf_cache_get(instruction)
+    cached = model_text is not None
+    if not cached:
+        prompt = build_parse_prompt(instruction)
+        try:
+            model_text = await enqueue_prompt(prompt)
+        except HFError as e:
+            await interaction.followup.send(f"❌ Hugging Face request failed: {e}")
+            return
     
     # Try to parse JSON from model_text
     try:
-        parsed = json.loads(model_text)
-    except Exception:
+        parsed = json_loads(model_text)
+    except json.JSONDecodeError:
         # sometimes model adds backticks or other noise; try to extract first JSON object
-        import re
-        m = re.search(r'(\{.*\})', model_text, flags=re.DOTALL)
+        m = _JSON_OBJ_RE.search(model_text)
         if m:
             try:
-                parsed = json.loads(m.group(1))
-            except Exception as e:
+                parsed = json_loads(m.group(0))
+            except json.JSONDecodeError as e:
                 await interaction.followup.send(f"Failed to parse Hugging Face response as JSON: {e}\n\nRaw response:\n```\n{model_text}\n```")
                 return
         else:
             await interaction.followup.send(f"Failed to parse Hugging Face response as JSON.\n\nRaw response:\n```\n{model_text}\n```")
             return
 
-    actions = parsed.get("actions", [])
+    actions = parsed.get("actions", []) if isinstance(parsed, dict) else []
     if not isinstance(actions, list) or len(actions) == 0:
         await interaction.followup.send("AI returned no actions to perform.")
         return
+    actions, error = validate_actions(actions)
+    if error:
+        await interaction.followup.send(f"❌ {error}")
+        return
+    # only cache responses that parsed into actions, never HF errors
+    if not cached:
+        hf_cache_put(instruction, model_text)
 
     # Determine if any action is destructive (delete_*)
     destructive = any(a.get("type","").startswith("delete_") for a in actions)
     
     if destructive and not auto_confirm:
         # ask for confirmation with a view
-        readable = json.dumps(actions, indent=2)
+        readable = json_dumps_pretty(actions)
         embed = discord.Embed(title="Confirm AI Actions",
                               description=f"The AI parsed the following actions from your instruction. Confirm to execute.\n\n```json\n{readable}\n```",
                               color=discord.Color.orange())
@@ -620,10 +1099,7 @@ async def server_ai(interaction: discord.Interaction, instruction: str, auto_con
         return
     else:
         # Directly execute (auto_confirm True or non-destructive)
-        results = []
-        for act in actions:
-            res = await execute_action(guild, act)
-            results.append(res)
+        results = await execute_actions(guild, actions)
         
         # Format results nicely
         success_count = sum(1 for r in results if r.get("ok"))
@@ -639,6 +1115,13 @@ async def server_ai(interaction: discord.Interaction, instruction: str, auto_con
         
         await interaction.followup.send(f"**{header}**\n{summary}")
 
+@bot.tree.command(name="ai_cache_clear", description="Clear cached AI responses (Admins only).")
+@ADMIN_CHECK
+async def ai_cache_clear(interaction: discord.Interaction):
+    count = len(HF_CACHE)
+    HF_CACHE.clear()
+    await interaction.response.send_message(f"🧹 Cleared {count} cached AI response(s).", ephemeral=True)
+
 # ---------- Run ----------
 if __name__ == "__main__":
     if not DISCORD_TOKEN:
@@ -650,8 +1133,5 @@ if __name__ == "__main__":
     
     print("Starting Discord AI Admin Bot with Hugging Face...")
     
-    # Start the web server for UptimeRobot monitoring
-    keep_alive()
-    
-    # Start the Discord bot
+    # Start the Discord bot (the UptimeRobot web server starts in setup_hook)
     bot.run(DISCORD_TOKEN)
\ No newline at end of file